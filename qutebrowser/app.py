@@ -62,6 +62,7 @@ except ImportError:
 import qutebrowser
 import qutebrowser.resources
 from qutebrowser.completion.models import miscmodels
+from qutebrowser.completion.models import util as completionutil
 from qutebrowser.commands import runners
 from qutebrowser.api import cmdutils
 from qutebrowser.config import config, websettings, configfiles, configinit
@@ -449,6 +450,9 @@ def _init_modules(*, args, crash_handler, quitter):
     log.init.debug("Initializing prompts...")
     prompt.init()
 
+    log.init.debug("Initializing completions...")
+    completionutil.init()
+
     log.init.debug("Initializing network...")
     networkmanager.init()
 
@@ -148,5 +148,6 @@ def bind(key, *, info):
 
     cmdlist = util.get_cmd_completions(info, include_hidden=True,
                                        include_aliases=True)
-    model.add_category(listcategory.ListCategory("Commands", cmdlist))
+    model.add_category(listcategory.ListCategory("Commands", cmdlist,
+                                                 sort=False))
     return model
@@ -26,25 +26,48 @@ from qutebrowser.utils import objreg, log
 from qutebrowser.completion.models import completionmodel, listcategory, util
 
 
+_SettingRowType = typing.Tuple[str, str]
+_SettingsCacheType = typing.Tuple[typing.Mapping[str, configdata.Option],
+                                  typing.List[_SettingRowType]]
+
+# A (configdata.DATA, rows) tuple caching the settings for helptopic.
+_settings_cache = None  # type: typing.Optional[_SettingsCacheType]
+
+
 def command(*, info):
     """A CompletionModel filled with non-hidden commands and descriptions."""
     model = completionmodel.CompletionModel(column_widths=(20, 60, 20))
     cmdlist = util.get_cmd_completions(info, include_aliases=True,
                                        include_hidden=False)
-    model.add_category(listcategory.ListCategory("Commands", cmdlist))
+    model.add_category(listcategory.ListCategory("Commands", cmdlist,
+                                                 sort=False))
     return model
 
 
+def _settings_rows():
+    """Get (name, description) completion rows for all settings.
+
+    configdata.DATA never changes after it's been initialized, so the rows
+    only get built again if it got replaced.
+    """
+    global _settings_cache
+    if _settings_cache is None or _settings_cache[0] is not configdata.DATA:
+        rows = [(opt.name, opt.description)
+                for opt in configdata.DATA.values()]
+        _settings_cache = (configdata.DATA, rows)
+    return _settings_cache[1]
+
+
 def helptopic(*, info):
     """A CompletionModel filled with help topics."""
     model = completionmodel.CompletionModel()
 
     cmdlist = util.get_cmd_completions(info, include_aliases=False,
                                        include_hidden=True, prefix=':')
-    settings = ((opt.name, opt.description)
-                for opt in configdata.DATA.values())
+    settings = _settings_rows()
 
-    model.add_category(listcategory.ListCategory("Commands", cmdlist))
+    model.add_category(listcategory.ListCategory("Commands", cmdlist,
+                                                 sort=False))
     model.add_category(listcategory.ListCategory("Settings", settings))
     return model
 
@@ -123,10 +146,11 @@ def _buffer(skip_win_id=None):
                                     window=win_id)
         if tabbed_browser.shutting_down:
             continue
+        prefix = '{}/'.format(win_id)
         tabs = []  # type: typing.List[typing.Tuple[str, str, str]]
         for idx in range(tabbed_browser.widget.count()):
             tab = tabbed_browser.widget.widget(idx)
-            tabs.append(("{}/{}".format(win_id, idx + 1),
+            tabs.append((prefix + str(idx + 1),
                          tab.url().toDisplayString(),
                          tabbed_browser.widget.page_title(idx)))
         if tabs_are_windows:
@@ -19,13 +19,41 @@
 
 """Utility functions for completion models."""
 
+import operator
 import typing
 
+from qutebrowser.config import config
 from qutebrowser.utils import usertypes
 from qutebrowser.misc import objects
 
 
 DeleteFuncType = typing.Callable[[typing.Sequence[str]], None]
+_CmdCompletionType = typing.List[typing.Tuple[str, str, str]]
+_CmdCacheType = typing.Dict[typing.Tuple[bool, bool, str], _CmdCompletionType]
+
+# Results of get_cmd_completions, keyed on its arguments.
+_cmd_completions_cache = {}  # type: _CmdCacheType
+
+
+def init() -> None:
+    """Clear cached command completions when aliases/bindings change."""
+    config.instance.changed.connect(_on_aliases_changed)
+    config.instance.changed.connect(_on_bindings_changed)
+
+
+def clear_cmd_completions() -> None:
+    """Clear the cached results of get_cmd_completions."""
+    _cmd_completions_cache.clear()
+
+
+@config.change_filter('aliases', function=True)
+def _on_aliases_changed() -> None:
+    clear_cmd_completions()
+
+
+@config.change_filter('bindings', function=True)
+def _on_bindings_changed() -> None:
+    clear_cmd_completions()
 
 
 def get_cmd_completions(info, include_hidden, include_aliases, prefix=''):
@@ -37,12 +65,22 @@ def get_cmd_completions(info, include_hidden, include_aliases, prefix=''):
         include_aliases: True to include command aliases.
         prefix: String to append to the command name.
 
+    The result is cached until the aliases or the bindings change, so
+    callers must not modify the returned list. As it's already sorted,
+    ListCategory can be used with sort=False for it.
+
     Return: A list of tuples of form (name, description, bindings).
     """
     assert objects.commands
+    key = (include_hidden, include_aliases, prefix)
+    try:
+        return _cmd_completions_cache[key]
+    except KeyError:
+        pass
+
     cmdlist = []
     cmd_to_keys = info.keyconf.get_reverse_bindings_for('normal')
-    for obj in set(objects.commands.values()):
+    for obj in objects.commands.values():
         hide_debug = obj.debug and not objects.args.debug
         hide_mode = (usertypes.KeyMode.normal not in obj.modes and
                      not include_hidden)
@@ -55,4 +93,6 @@ def get_cmd_completions(info, include_hidden, include_aliases, prefix=''):
             bindings = ', '.join(cmd_to_keys.get(name, []))
             cmdlist.append((name, "Alias for '{}'".format(cmd), bindings))
 
-    return sorted(cmdlist)
+    cmdlist.sort(key=operator.itemgetter(0))
+    _cmd_completions_cache[key] = cmdlist
+    return cmdlist
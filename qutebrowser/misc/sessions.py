@@ -120,6 +120,9 @@ class SessionManager(QObject):
         _base_path: The path to store sessions under.
         _last_window_session: The session data of the last window which was
                               closed.
+        _session_names: The names found by the last list_sessions() call.
+        _session_names_mtime: The mtime of _base_path _session_names is from,
+                              or None if they need to be listed again.
         current: The name of the currently loaded session, or None.
         did_load: Set when a session was loaded.
     """
@@ -129,6 +132,8 @@ class SessionManager(QObject):
         self.current = None  # type: typing.Optional[str]
         self._base_path = base_path
         self._last_window_session = None
+        self._session_names = []  # type: typing.List[str]
+        self._session_names_mtime = None  # type: typing.Optional[int]
         self.did_load = False
 
     def _get_session_path(self, name, check_exists=False):
@@ -312,6 +317,7 @@ class SessionManager(QObject):
             data = self._save_all(only_window=only_window,
                                   with_private=with_private)
         log.sessions.vdebug("Saving data: {}".format(data))  # type: ignore
+        self._session_names_mtime = None
         try:
             with qtutils.savefile_open(path) as f:
                 utils.yaml_dump(data, f)  # type: ignore
@@ -470,19 +476,30 @@ class SessionManager(QObject):
     def delete(self, name):
         """Delete a session."""
         path = self._get_session_path(name, check_exists=True)
+        self._session_names_mtime = None
         try:
             os.remove(path)
         except OSError as e:
             raise SessionError(e)
 
     def list_sessions(self):
-        """Get a list of all session names."""
+        """Get a list of all session names.
+
+        The directory only gets listed again when its mtime changed.
+        """
+        mtime = os.stat(self._base_path).st_mtime_ns
+        if mtime == self._session_names_mtime:
+            return list(self._session_names)
+
         sessions = []
         for filename in os.listdir(self._base_path):
             base, ext = os.path.splitext(filename)
             if ext == '.yml':
                 sessions.append(base)
-        return sorted(sessions)
+        sessions.sort()
+        self._session_names = sessions
+        self._session_names_mtime = mtime
+        return list(sessions)
 
 
 @cmdutils.register()
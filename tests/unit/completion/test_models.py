@@ -29,7 +29,8 @@ from PyQt5.QtCore import QUrl
 
 from qutebrowser.misc import objects
 from qutebrowser.completion import completer
-from qutebrowser.completion.models import miscmodels, urlmodel, configmodel
+from qutebrowser.completion.models import (miscmodels, urlmodel, configmodel,
+                                           util)
 from qutebrowser.config import configdata, configtypes
 from qutebrowser.utils import usertypes
 
@@ -63,6 +64,12 @@ def _check_completions(model, expected):
     assert sum(model.column_widths) == 100
 
 
+@pytest.fixture(autouse=True)
+def clear_cmd_completions():
+    """Make sure cached command completions don't leak between tests."""
+    util.clear_cmd_completions()
+
+
 @pytest.fixture()
 def cmdutils_stub(monkeypatch, stubs):
     """Patch the cmdutils module to provide fake commands."""
@@ -132,7 +139,8 @@ def configdata_stub(config_stub, monkeypatch, configdata_init):
                     ('d', 'scroll down'),
                 ])
             },
-            backends=[],
+            backends=[usertypes.Backend.QtWebKit,
+                      usertypes.Backend.QtWebEngine],
             raw_backends=None)),
         ('content.javascript.enabled', configdata.Option(
             name='content.javascript.enabled',
@@ -237,6 +245,40 @@ def test_command_completion(qtmodeltester, cmdutils_stub, configdata_stub,
     })
 
 
+def test_command_completion_cache(cmdutils_stub, configdata_stub,
+                                  config_stub, key_config_stub, info):
+    """Make sure command completions are cached until aliases/bindings change.
+    """
+    util.init()
+    cmdlist = util.get_cmd_completions(info, include_hidden=False,
+                                       include_aliases=True)
+    assert util.get_cmd_completions(info, include_hidden=False,
+                                    include_aliases=True) is cmdlist
+
+    config_stub.val.aliases = {'o': 'open'}
+    new_cmdlist = util.get_cmd_completions(info, include_hidden=False,
+                                           include_aliases=True)
+    assert new_cmdlist is not cmdlist
+    assert new_cmdlist == [
+        ('o', "Alias for 'open'", ''),
+        ('open', 'open a url', ''),
+        ('quit', 'quit qutebrowser', 'ZQ, <Ctrl+q>'),
+        ('tab-close', 'Close the current tab.', ''),
+    ]
+
+    cmdlist = new_cmdlist
+    config_stub.val.bindings.commands = {'normal': {'go': 'open'}}
+    new_cmdlist = util.get_cmd_completions(info, include_hidden=False,
+                                           include_aliases=True)
+    assert new_cmdlist is not cmdlist
+    assert new_cmdlist == [
+        ('o', "Alias for 'open'", ''),
+        ('open', 'open a url', 'go'),
+        ('quit', 'quit qutebrowser', '<Ctrl+q>'),
+        ('tab-close', 'Close the current tab.', 'd'),
+    ]
+
+
 def test_help_completion(qtmodeltester, cmdutils_stub, key_config_stub,
                          configdata_stub, config_stub, info):
     """Test the results of command completion.
@@ -20,6 +20,7 @@
 """Tests for qutebrowser.misc.sessions."""
 
 import logging
+import os
 
 import pytest
 import yaml
@@ -371,3 +372,30 @@ class TestListSessions:
         (tmpdir / 'bar.html').ensure()
         sess_man = sessions.SessionManager(str(tmpdir))
         assert sess_man.list_sessions() == ['foo']
+
+    def test_cached(self, tmpdir, mocker):
+        (tmpdir / 'foo.yml').ensure()
+        sess_man = sessions.SessionManager(str(tmpdir))
+        assert sess_man.list_sessions() == ['foo']
+
+        listdir_mock = mocker.patch('qutebrowser.misc.sessions.os.listdir')
+        assert sess_man.list_sessions() == ['foo']
+        assert not listdir_mock.called
+
+    def test_cache_delete(self, tmpdir):
+        (tmpdir / 'foo.yml').ensure()
+        (tmpdir / 'bar.yml').ensure()
+        sess_man = sessions.SessionManager(str(tmpdir))
+        assert sess_man.list_sessions() == ['bar', 'foo']
+
+        sess_man.delete('foo')
+        assert sess_man.list_sessions() == ['bar']
+
+    def test_cache_invalidated(self, tmpdir):
+        (tmpdir / 'foo.yml').ensure()
+        sess_man = sessions.SessionManager(str(tmpdir))
+        assert sess_man.list_sessions() == ['foo']
+
+        (tmpdir / 'bar.yml').ensure()
+        os.utime(str(tmpdir), ns=(0, 0))
+        assert sess_man.list_sessions() == ['bar', 'foo']